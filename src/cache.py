@@ -1,58 +1,204 @@
 """Caching abstraction for pipeline outputs."""
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
 from datetime import date
+from typing import Iterable
 from pathlib import Path
 from typing import Generic, TypeVar
 
 T = TypeVar('T')
 
+# Max raw payloads kept in memory per cache instance
+MEM_CACHE_MAX_ENTRIES = 10_000
+
+# Max per-day SQLite connections held open at once
+MAX_OPEN_DAY_DBS = 32
+
 
 class FileCache(Generic[T]):
-    """Simple file-based cache for serializable objects."""
+    """Simple file-based cache for serializable objects.
+
+    Raw payloads are memoized in an in-process LRU dict so repeated
+    access to the same key within a run skips the stat+open+read.
+    """
 
     def __init__(self, cache_dir: Path):
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._mem: OrderedDict[str, bytes] = OrderedDict()
+
+    def _mem_get(self, cache_file: Path) -> bytes | None:
+        """Return memoized payload for a cache file, refreshing LRU order."""
+        payload = self._mem.get(str(cache_file))
+        if payload is not None:
+            self._mem.move_to_end(str(cache_file))
+        return payload
+
+    def _mem_put(self, cache_file: Path, payload: bytes) -> None:
+        """Memoize a payload, evicting least-recently-used entries."""
+        self._mem[str(cache_file)] = payload
+        self._mem.move_to_end(str(cache_file))
+        while len(self._mem) > MEM_CACHE_MAX_ENTRIES:
+            self._mem.popitem(last=False)
+
+    def _read(self, cache_file: Path, loader) -> T | None:
+        """Load from memory if possible, falling back to disk.
+
+        Reads EAFP — one open() instead of an exists() stat plus a read.
+        """
+        payload = self._mem_get(cache_file)
+        if payload is None:
+            try:
+                payload = cache_file.read_bytes()
+            except FileNotFoundError:
+                return None
+            self._mem_put(cache_file, payload)
+        return loader(payload)
 
     def get(self, key: str, loader) -> T | None:
         """Get cached item, returning None if not found."""
-        cache_file = self.cache_dir / f"{key}.json"
-        if cache_file.exists():
-            return loader(cache_file.read_text())
-        return None
+        return self._read(self.cache_dir / f"{key}.json", loader)
 
     def save(self, key: str, value: T, serializer) -> None:
-        """Save item to cache."""
+        """Save item to cache. The serializer must return bytes."""
         cache_file = self.cache_dir / f"{key}.json"
-        cache_file.write_text(serializer(value))
+        payload = serializer(value)
+        cache_file.write_bytes(payload)
+        self._mem_put(cache_file, payload)
 
     def exists(self, key: str) -> bool:
         """Check if item exists in cache."""
-        return (self.cache_dir / f"{key}.json").exists()
+        cache_file = self.cache_dir / f"{key}.json"
+        return str(cache_file) in self._mem or cache_file.exists()
+
+    def invalidate(self, key: str) -> None:
+        """Drop a cached item from memory and disk."""
+        cache_file = self.cache_dir / f"{key}.json"
+        self._mem.pop(str(cache_file), None)
+        try:
+            cache_file.unlink()
+        except FileNotFoundError:
+            pass
 
 
 class DateOrganizedCache(FileCache):
-    """Cache organized by date: YYYY-MM/DD/key.json"""
+    """Cache organized by date, packed into one SQLite file per day.
 
-    def get_dated(self, key: str, target_date: date, loader) -> T | None:
-        """Get cached item organized by date."""
+    Entries for a day live in YYYY-MM/DD.db (table entries(key, data)),
+    so a day costs one open file instead of one inode per ticket. Legacy
+    per-key YYYY-MM/DD/key.json files are still read as a fallback.
+    """
+
+    def __init__(self, cache_dir: Path):
+        super().__init__(cache_dir)
+        self._present: dict[date, set[str]] = {}
+        self._dbs: OrderedDict[Path, sqlite3.Connection] = OrderedDict()
+        self._db_lock = threading.Lock()
+
+    def _dated_dir(self, target_date: date) -> Path:
         year_month = target_date.strftime("%Y-%m")
         day = target_date.strftime("%d")
-        cache_file = self.cache_dir / year_month / day / f"{key}.json"
-        if cache_file.exists():
-            return loader(cache_file.read_text())
-        return None
+        return self.cache_dir / year_month / day
 
-    def save_dated(self, key: str, target_date: date, value: T, serializer) -> None:
-        """Save item to date-organized cache."""
+    def _dated_file(self, key: str, target_date: date) -> Path:
+        return self._dated_dir(target_date) / f"{key}.json"
+
+    def _db_path(self, target_date: date) -> Path:
         year_month = target_date.strftime("%Y-%m")
         day = target_date.strftime("%d")
-        cache_dir = self.cache_dir / year_month / day
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        cache_file = cache_dir / f"{key}.json"
-        cache_file.write_text(serializer(value))
+        return self.cache_dir / year_month / f"{day}.db"
+
+    def _connect(self, target_date: date) -> sqlite3.Connection:
+        """Open (or reuse) the day's database, evicting LRU connections.
+
+        Callers must hold self._db_lock.
+        """
+        db_path = self._db_path(target_date)
+        conn = self._dbs.get(db_path)
+        if conn is None:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, data BLOB)"
+            )
+            self._dbs[db_path] = conn
+        self._dbs.move_to_end(db_path)
+        while len(self._dbs) > MAX_OPEN_DAY_DBS:
+            _, evicted = self._dbs.popitem(last=False)
+            evicted.close()
+        return conn
+
+    def _db_get(self, key: str, target_date: date) -> bytes | None:
+        """Fetch one payload from the day's database, if it exists."""
+        db_path = self._db_path(target_date)
+        with self._db_lock:
+            if db_path not in self._dbs and not db_path.exists():
+                return None
+            conn = self._connect(target_date)
+            row = conn.execute(
+                "SELECT data FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def scan_dates(self, dates: Iterable[date]) -> None:
+        """Pre-list cached keys for the given dates, one scan each."""
+        for target_date in dates:
+            if target_date in self._present:
+                continue
+            keys: set[str] = set()
+            if self._db_path(target_date).exists():
+                with self._db_lock:
+                    conn = self._connect(target_date)
+                    keys = {row[0] for row in conn.execute("SELECT key FROM entries")}
+            day_dir = self._dated_dir(target_date)
+            if day_dir.is_dir():
+                with os.scandir(day_dir) as entries:
+                    keys |= {
+                        entry.name.removesuffix(".json")
+                        for entry in entries
+                        if entry.name.endswith(".json")
+                    }
+            self._present[target_date] = keys
+
+    def get_dated(self, key: str, target_date: date, loader) -> T | None:
+        """Get cached item organized by date."""
+        cache_file = self._dated_file(key, target_date)
+        payload = self._mem_get(cache_file)
+        if payload is None:
+            payload = self._db_get(key, target_date)
+        if payload is None:
+            # Legacy per-key file layout
+            try:
+                payload = cache_file.read_bytes()
+            except FileNotFoundError:
+                return None
+        self._mem_put(cache_file, payload)
+        return loader(payload)
+
+    def save_dated(self, key: str, target_date: date, value: T, serializer) -> None:
+        """Save item to date-organized cache. The serializer must return bytes."""
+        payload = serializer(value)
+        with self._db_lock:
+            conn = self._connect(target_date)
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, data) VALUES (?, ?)",
+                (key, payload)
+            )
+            conn.commit()
+        self._mem_put(self._dated_file(key, target_date), payload)
+        if target_date in self._present:
+            self._present[target_date].add(key)
 
     def exists_dated(self, key: str, target_date: date) -> bool:
         """Check if dated item exists in cache."""
-        year_month = target_date.strftime("%Y-%m")
-        day = target_date.strftime("%d")
-        return (self.cache_dir / year_month / day / f"{key}.json").exists()
+        present = self._present.get(target_date)
+        if present is not None:
+            return key in present
+        cache_file = self._dated_file(key, target_date)
+        if str(cache_file) in self._mem:
+            return True
+        if self._db_get(key, target_date) is not None:
+            return True
+        return cache_file.exists()
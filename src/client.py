@@ -1,7 +1,11 @@
 """Anthropic API client abstraction."""
 import asyncio
-import json
 import os
+import time
+
+import httpx
+import numpy as np
+import orjson
 from anthropic import AsyncAnthropic
 from dotenv import load_dotenv
 
@@ -15,42 +19,116 @@ if not API_KEY:
 class APIClient:
     """Wrapper around Anthropic API with retry and timeout handling."""
 
-    def __init__(self, model: str = "claude-haiku-4-5", max_retries: int = 3):
-        self.client = AsyncAnthropic(api_key=API_KEY)
+    def __init__(
+        self,
+        model: str = "claude-haiku-4-5",
+        max_retries: int = 3,
+        requests_per_second: float = 5.0
+    ):
+        # One keep-alive pool shared by every layer for the whole run
+        self.client = AsyncAnthropic(
+            api_key=API_KEY,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=64)
+            )
+        )
         self.model = model
         self.max_retries = max_retries
+        self.requests_per_second = requests_per_second
+        self._tokens = requests_per_second
+        self._last_refill = time.monotonic()
+        self._rate_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "APIClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.client.close()
+
+    async def _acquire_token(self) -> None:
+        """Wait until the token bucket grants one request slot."""
+        async with self._rate_lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.requests_per_second,
+                    self._tokens + (now - self._last_refill) * self.requests_per_second
+                )
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.requests_per_second)
+
+    async def _request(
+        self,
+        prompt: str,
+        max_tokens: int,
+        timeout: float,
+        schema: dict | None = None
+    ) -> str | dict:
+        """Stream one response; a schema forces tool-shaped JSON output.
+
+        With a schema the model is constrained to a single tool call
+        whose input must validate against it, so the result arrives as
+        an already-parsed dict — no prose, no client-side JSON repair.
+        """
+        if schema is not None:
+            async def consume_structured() -> dict:
+                async with self.client.messages.stream(
+                    model=self.model,
+                    max_tokens=max_tokens,
+                    messages=[{"role": "user", "content": prompt}],
+                    tools=[{
+                        "name": "record_result",
+                        "description": "Record the structured analysis result.",
+                        "input_schema": schema
+                    }],
+                    tool_choice={"type": "tool", "name": "record_result"}
+                ) as stream:
+                    message = await stream.get_final_message()
+                for block in message.content:
+                    if block.type == "tool_use":
+                        return block.input
+                raise ValueError("Response contained no tool_use block")
+
+            return await asyncio.wait_for(consume_structured(), timeout=timeout)
+
+        chunks: list[str] = []
+
+        async def consume() -> None:
+            async with self.client.messages.stream(
+                model=self.model,
+                max_tokens=max_tokens,
+                messages=[{"role": "user", "content": prompt}]
+            ) as stream:
+                async for text in stream.text_stream:
+                    chunks.append(text)
+
+        await asyncio.wait_for(consume(), timeout=timeout)
+        return "".join(chunks).strip()
 
     async def call(
         self,
         prompt: str,
         max_tokens: int = 1024,
         timeout: float = 60.0,
-        semaphore: asyncio.Semaphore | None = None
-    ) -> str:
-        """Call the API with automatic retry and timeout handling."""
+        semaphore: asyncio.Semaphore | None = None,
+        schema: dict | None = None
+    ) -> str | dict:
+        """Call the API with automatic retry and timeout handling.
+
+        A schema constrains the response and yields a parsed dict.
+        """
         for attempt in range(self.max_retries):
             try:
                 if semaphore:
                     async with semaphore:
-                        response = await asyncio.wait_for(
-                            self.client.messages.create(
-                                model=self.model,
-                                max_tokens=max_tokens,
-                                messages=[{"role": "user", "content": prompt}]
-                            ),
-                            timeout=timeout
-                        )
-                else:
-                    response = await asyncio.wait_for(
-                        self.client.messages.create(
-                            model=self.model,
-                            max_tokens=max_tokens,
-                            messages=[{"role": "user", "content": prompt}]
-                        ),
-                        timeout=timeout
-                    )
-
-                return response.content[0].text.strip()
+                        await self._acquire_token()
+                        return await self._request(prompt, max_tokens, timeout, schema)
+
+                await self._acquire_token()
+                return await self._request(prompt, max_tokens, timeout, schema)
 
             except asyncio.TimeoutError:
                 if attempt < self.max_retries - 1:
@@ -77,11 +155,16 @@ def parse_json(content: str) -> dict:
                 content = content[4:]
             content = content.strip()
 
-    # Try parsing as-is first
-    try:
-        return json.loads(content)
-    except json.JSONDecodeError:
-        pass
+    raw = content.encode()
+
+    # Happy path: well-formed response, parsed in a single pass from bytes.
+    # Only worth attempting when the last non-whitespace character can
+    # actually terminate JSON; otherwise go straight to repair.
+    if content.rstrip()[-1:] in ("}", "]"):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
 
     # Try truncating at last closing brace/bracket
     last_brace = content.rfind('}')
@@ -91,47 +174,42 @@ def parse_json(content: str) -> dict:
     if last_close > 0:
         truncated = content[:last_close + 1]
         try:
-            return json.loads(truncated)
-        except json.JSONDecodeError:
+            return orjson.loads(truncated)
+        except orjson.JSONDecodeError:
             pass
 
-    # Try counting braces to find structure boundaries
-    open_braces = 0
-    open_brackets = 0
-    in_string = False
-    escape_next = False
-
-    for i, char in enumerate(content):
-        if escape_next:
-            escape_next = False
-            continue
-
-        if char == '\\' and in_string:
-            escape_next = True
-            continue
-
-        if char == '"' and not escape_next:
-            in_string = not in_string
-            continue
-
-        if not in_string:
-            if char == '{':
-                open_braces += 1
-            elif char == '}':
-                open_braces -= 1
-            elif char == '[':
-                open_brackets += 1
-            elif char == ']':
-                open_brackets -= 1
-
-            if open_braces == 0 and open_brackets == 0 and char in ('}', ']'):
-                truncated = content[:i + 1]
-                try:
-                    return json.loads(truncated)
-                except json.JSONDecodeError:
-                    pass
-
-    raise json.JSONDecodeError(
+    # Vectorized scan for structure boundaries: mask out string contents,
+    # cumsum brace/bracket depths, and try each offset where both hit zero
+    arr = np.frombuffer(raw, dtype=np.uint8)
+    if arr.size:
+        positions = np.arange(arr.size)
+        is_backslash = arr == 0x5C
+        last_non_backslash = np.maximum.accumulate(
+            np.where(~is_backslash, positions, -1)
+        )
+        backslash_run = positions - last_non_backslash
+        escaped = np.zeros(arr.size, dtype=bool)
+        escaped[1:] = (backslash_run[:-1] % 2) == 1
+
+        quote_toggles = (arr == 0x22) & ~escaped
+        in_string = (np.cumsum(quote_toggles) % 2).astype(bool)
+        structural = ~in_string
+
+        brace_depth = np.cumsum(
+            ((arr == 0x7B).astype(np.int32) - (arr == 0x7D)) * structural
+        )
+        bracket_depth = np.cumsum(
+            ((arr == 0x5B).astype(np.int32) - (arr == 0x5D)) * structural
+        )
+        closers = ((arr == 0x7D) | (arr == 0x5D)) & structural
+
+        for end in np.where((brace_depth == 0) & (bracket_depth == 0) & closers)[0]:
+            try:
+                return orjson.loads(raw[:end + 1])
+            except orjson.JSONDecodeError:
+                pass
+
+    raise orjson.JSONDecodeError(
         f"Could not parse JSON. Last 500 chars: {content[-500:]}",
         content,
         len(content) - 1
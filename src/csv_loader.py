@@ -1,31 +1,69 @@
 """CSV data loading and parsing."""
-import json
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 from pathlib import Path
 
+import orjson
 import pandas as pd
 
 
-def get_date_range(csv_path: Path) -> tuple[date, date]:
-    """Extract date range from CSV (latest and previous day)."""
-    df = pd.read_csv(csv_path)
-
-    dates = []
-    for row in df.itertuples():
-        try:
-            dt = datetime.fromisoformat(str(row.ds).replace("Z", "+00:00"))
-            dates.append(dt.date())
-        except (ValueError, AttributeError):
-            continue
-
-    if not dates:
-        raise ValueError("No valid dates found in CSV")
+def _parse_extra(value) -> dict:
+    """Parse a ticket's `extra` JSON blob, returning {} on any failure."""
+    if not isinstance(value, str) or not value:
+        return {}
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        return {}
+
+
+def _load_frame(csv_path: Path) -> tuple[pd.DataFrame, pd.Series]:
+    """Read the CSV once and parse its ds column in one vectorized pass."""
+    df = pd.read_csv(csv_path, engine="pyarrow")
+    parsed = pd.to_datetime(df["ds"], utc=True, errors="coerce")
+    return df, parsed
 
-    latest_date = max(dates)
+
+def _range_of(parsed: pd.Series) -> tuple[date, date]:
+    """Date range (latest and previous day) from parsed timestamps."""
+    valid = parsed.dropna()
+    if valid.empty:
+        raise ValueError("No valid dates found in CSV")
+    latest_date = valid.max().date()
     previous_date = latest_date - timedelta(days=1)
     return previous_date, latest_date
 
 
+def _range_sidecar(csv_path: Path) -> Path:
+    return csv_path.with_name(f".{csv_path.stem}.daterange.json")
+
+
+def get_date_range(csv_path: Path) -> tuple[date, date]:
+    """Extract date range from CSV (latest and previous day).
+
+    The result is cached in a sidecar file keyed by the CSV's mtime and
+    size, so reruns over unchanged data skip the full scan.
+    """
+    meta = csv_path.stat()
+    cache_key = f"{meta.st_mtime_ns}-{meta.st_size}"
+    sidecar = _range_sidecar(csv_path)
+    try:
+        cached = orjson.loads(sidecar.read_bytes())
+        if cached.get("key") == cache_key:
+            return (
+                date.fromisoformat(cached["start"]),
+                date.fromisoformat(cached["end"])
+            )
+    except (FileNotFoundError, orjson.JSONDecodeError, KeyError, ValueError):
+        pass
+
+    _, parsed = _load_frame(csv_path)
+    start, end = _range_of(parsed)
+    sidecar.write_bytes(orjson.dumps(
+        {"key": cache_key, "start": start.isoformat(), "end": end.isoformat()}
+    ))
+    return start, end
+
+
 def load_tickets(
     csv_path: Path,
     start_date: date | None = None,
@@ -35,50 +73,72 @@ def load_tickets(
 
     Returns list of dicts with: id, content, created_at, metadata
     """
-    df = pd.read_csv(csv_path)
+    df, parsed = _load_frame(csv_path)
+    return _build_tickets(df, parsed, start_date, end_date)
+
+
+def load_tickets_with_range(
+    csv_path: Path,
+    start_date: date | None = None,
+    end_date: date | None = None
+) -> tuple[date, date, list[dict]]:
+    """Load tickets and resolve the date range with a single CSV read.
+
+    Missing bounds default to the CSV's (previous, latest) day pair.
+    Returns (start_date, end_date, tickets).
+    """
+    df, parsed = _load_frame(csv_path)
+    if start_date is None or end_date is None:
+        default_start, default_end = _range_of(parsed)
+        start_date = start_date or default_start
+        end_date = end_date or default_end
+    return start_date, end_date, _build_tickets(df, parsed, start_date, end_date)
+
+
+def _build_tickets(
+    df: pd.DataFrame,
+    parsed: pd.Series,
+    start_date: date | None,
+    end_date: date | None
+) -> list[dict]:
+    """Build ticket dicts from an already-parsed frame."""
+    ticket_dates = parsed.dt.date
+
+    # Filter before any per-row work; rows with unparseable dates are kept
+    mask = pd.Series(True, index=df.index)
+    if start_date is not None:
+        mask &= (ticket_dates >= start_date) | parsed.isna()
+    if end_date is not None:
+        mask &= (ticket_dates <= end_date) | parsed.isna()
+    df = df.loc[mask]
+    parsed = parsed.loc[mask]
+
+    # ISO timestamps for parsed rows, raw ds value as fallback
+    created_at = parsed.dt.strftime("%Y-%m-%dT%H:%M:%S%z")
+    created_at = created_at.where(parsed.notna(), df["ds"].astype(str))
+
+    content_col = (
+        df["original_message"].tolist()
+        if "original_message" in df.columns else [""] * len(df)
+    )
+    # Parse the whole extra column up front with orjson
+    extras = (
+        [_parse_extra(x) for x in df["extra"].tolist()]
+        if "extra" in df.columns else [{}] * len(df)
+    )
 
     tickets = []
-    for idx, row in df.iterrows():
-        # Parse timestamp
-        created_at_str = row["ds"]
-        ticket_date = None
-        if isinstance(created_at_str, str):
-            try:
-                dt = datetime.fromisoformat(created_at_str.replace("Z", "+00:00"))
-                ticket_date = dt.date()
-                created_at = dt.isoformat()
-            except (ValueError, AttributeError):
-                created_at = str(created_at_str)
-        else:
-            created_at = str(created_at_str)
-
-        # Filter by date range if specified
-        if start_date is not None and ticket_date is not None:
-            if ticket_date < start_date:
-                continue
-        if end_date is not None and ticket_date is not None:
-            if ticket_date > end_date:
-                continue
-
-        # Parse extra JSON
-        extra_data = {}
-        if pd.notna(row.get("extra")):
-            try:
-                extra_data = json.loads(row["extra"])
-            except (json.JSONDecodeError, TypeError):
-                pass
-
-        # Build ticket
-        content = row.get("original_message", "")
+    for idx, content, created, extra_data in zip(
+        df.index, content_col, created_at.tolist(), extras
+    ):
         if pd.isna(content):
             content = ""
 
-        ticket = {
+        tickets.append({
             "id": f"ticket_{idx}",
             "content": str(content),
-            "created_at": created_at,
+            "created_at": created,
             "metadata": extra_data,
-        }
-        tickets.append(ticket)
+        })
 
     return tickets
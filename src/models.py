@@ -1,6 +1,6 @@
 """Data models for pipeline layers."""
 from datetime import date
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class TicketAnalysis(BaseModel):
@@ -24,49 +24,81 @@ class DailySummary(BaseModel):
 
 
 class HealthSnapshot(BaseModel):
-    """System health metrics."""
-    overall_health: str
-    ticket_volume_trend: str
-    complaint_rate_trend: str
-    top_3_drivers: list[str]
+    """System health metrics.
+
+    Field descriptions ship in the response schema, so the report
+    prompt no longer has to describe the output shape in prose.
+    """
+    overall_health: str = Field(description=(
+        '"critical" | "concerning" | "stable" | "improving", '
+        'with brief justification'
+    ))
+    ticket_volume_trend: str = Field(description="Numerical change with percentage")
+    complaint_rate_trend: str = Field(description="Numerical change with percentage")
+    top_3_drivers: list[str] = Field(description=(
+        "Issue types driving the most volume"
+    ))
 
 
 class KeyInsight(BaseModel):
     """Notable pattern or finding."""
-    insight: str
-    severity: str
-    evidence: str
-    customer_impact: str
+    insight: str = Field(description="The finding itself")
+    severity: str = Field(description='"critical" | "high" | "medium" | "low"')
+    evidence: str = Field(description=(
+        "Specific data points or patterns supporting this"
+    ))
+    customer_impact: str = Field(description=(
+        "How this affects customer experience"
+    ))
 
 
 class RecommendedAction(BaseModel):
     """Actionable recommendation."""
-    action: str
-    priority: str
-    estimated_impact: str
-    suggested_owner: str
-    success_metrics: str
+    action: str = Field(description="Specific, actionable task")
+    priority: str = Field(description='"immediate" | "this_week" | "this_month"')
+    estimated_impact: str = Field(description=(
+        '"high" | "medium" | "low" - expected reduction in ticket volume '
+        'or complaint rate'
+    ))
+    suggested_owner: str = Field(description=(
+        'Which team should own this (e.g., "Engineering", "Operations", '
+        '"Product", "Support")'
+    ))
+    success_metrics: str = Field(description=(
+        "How to measure if this worked (specific KPIs)"
+    ))
 
 
 class CustomerVoice(BaseModel):
     """Customer quotes and feedback."""
-    quotes: list[str]
+    quotes: list[str] = Field(description=(
+        "2-3 verbatim or paraphrased ticket quotes that illustrate the "
+        "most critical issues; emotionally resonant"
+    ))
 
 
 class WeekOverWeekComparison(BaseModel):
     """Trends across time periods."""
-    improved: list[str]
-    deteriorated: list[str]
-    stayed_same: list[str]
+    improved: list[str] = Field(description="Actionable changes that improved")
+    deteriorated: list[str] = Field(description="Actionable changes that deteriorated")
+    stayed_same: list[str] = Field(description="What stayed the same")
 
 
 class Report(BaseModel):
     """Executive summary report."""
     period: str
-    executive_summary: str
+    executive_summary: str = Field(description=(
+        "Most critical insight first (what changed and why it matters), "
+        "key metrics with directional indicators (↑↓), ending with "
+        "business impact; 3-4 sentences max"
+    ))
     health_snapshot: HealthSnapshot
-    key_insights: list[KeyInsight]
-    recommended_actions: list[RecommendedAction]
+    key_insights: list[KeyInsight] = Field(description=(
+        "5 insights, prioritized by impact"
+    ))
+    recommended_actions: list[RecommendedAction] = Field(description=(
+        "3-5 actions, prioritized"
+    ))
     customer_voice: CustomerVoice
     week_over_week_comparison: WeekOverWeekComparison
 
@@ -1,27 +1,134 @@
 """Pipeline orchestration and layer coordination."""
 import asyncio
-from collections import Counter
-from datetime import date, datetime, timedelta
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from functools import cache, partial
+from hashlib import blake2b
+from itertools import chain
+
+import numpy as np
+import orjson
+from pydantic import TypeAdapter
 
 # Support both direct execution and module import
 try:
     from .models import TicketAnalysis, DailySummary, Report
-    from .prompts import EXTRACT_PROMPT, SUMMARIZE_PROMPT, REPORT_PROMPT
-    from .client import APIClient, parse_json
+    from .prompts import (
+        render_extract, render_extract_batch, render_summarize, render_report
+    )
+    from .client import APIClient
     from .cache import DateOrganizedCache, FileCache
 except ImportError:
     from models import TicketAnalysis, DailySummary, Report
-    from prompts import EXTRACT_PROMPT, SUMMARIZE_PROMPT, REPORT_PROMPT
-    from client import APIClient, parse_json
+    from prompts import (
+        render_extract, render_extract_batch, render_summarize, render_report
+    )
+    from client import APIClient
     from cache import DateOrganizedCache, FileCache
 
 
+# Precompiled pydantic-core adapters: validate_json accepts bytes directly
+# and dump_json returns bytes, skipping per-call schema lookup and utf-8 hops
+_TICKET_ADAPTER = TypeAdapter(TicketAnalysis)
+_SUMMARY_ADAPTER = TypeAdapter(DailySummary)
+_REPORT_ADAPTER = TypeAdapter(Report)
+
+_dump_ticket = partial(_TICKET_ADAPTER.dump_json, indent=2)
+_dump_summary = partial(_SUMMARY_ADAPTER.dump_json, indent=2)
+_dump_report = partial(_REPORT_ADAPTER.dump_json, indent=2)
+
+
+def _model_schema(model, *computed_fields: str) -> dict:
+    """JSON schema for a model, minus fields the pipeline fills itself."""
+    schema = model.model_json_schema()
+    for field in computed_fields:
+        schema["properties"].pop(field, None)
+        if field in schema.get("required", ()):
+            schema["required"].remove(field)
+    return schema
+
+
+# Tool input schemas: the API enforces these at generation time, so the
+# response arrives parsed and schema-valid with no prose around it
+_EXTRACT_SCHEMA = _model_schema(TicketAnalysis, "ticket_id")
+_EXTRACT_PACK_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "analyses": {
+            "type": "array",
+            "items": TicketAnalysis.model_json_schema()
+        }
+    },
+    "required": ["analyses"]
+}
+_SUMMARY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "key_themes": {"type": "array", "items": {"type": "string"}},
+        "trend_analysis": {"type": "string"},
+        "critical_issues": {"type": "array", "items": {"type": "string"}}
+    },
+    "required": ["key_themes", "trend_analysis", "critical_issues"]
+}
+_REPORT_SCHEMA = _model_schema(Report, "period")
+
+# Cache bytes were serialized by this same code, so CACHE_TRUST=1 may skip
+# validation on ticket reads. DailySummary keeps validation either way
+# because its date field needs coercion from the JSON string.
+_CACHE_TRUST = os.getenv("CACHE_TRUST") == "1"
+
+logger = logging.getLogger(__name__)
+
+
+def _construct_ticket(raw: bytes) -> TicketAnalysis:
+    """Build a TicketAnalysis from trusted cache bytes, skipping validation."""
+    return TicketAnalysis.model_construct(**orjson.loads(raw))
+
+
+_load_ticket = _construct_ticket if _CACHE_TRUST else _TICKET_ADAPTER.validate_json
+
+# How many completed extractions to buffer before a checkpoint append
+CHECKPOINT_EVERY = 100
+
+# How many extraction tasks to keep alive at once; bounds Task allocation
+TASK_CHUNK_SIZE = 256
+
+
+def _chunks(items: list, n: int):
+    """Yield successive n-sized slices of a list."""
+    for i in range(0, len(items), n):
+        yield items[i:i + n]
+
+
+def _content_key(ticket_content: str) -> str:
+    """Content-addressed cache key: hash of normalized ticket text."""
+    normalized = " ".join(ticket_content.lower().split())
+    return blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+
+@cache
+def _summary_block(date_iso: str, ticket_count: int, themes: tuple, trend_analysis: str) -> str:
+    """Format one daily summary for the report prompt, memoized across calls."""
+    return (
+        f"Date: {date_iso}\nTickets: {ticket_count}\n"
+        f"Themes: {', '.join(themes)}\n"
+        f"Analysis: {trend_analysis}"
+    )
+
+
 class Extractor:
     """Layer 1: Extract structured data from individual tickets."""
 
     def __init__(self, cache_dir, api_client: APIClient):
         self.cache = DateOrganizedCache(cache_dir)
+        # Content-addressed tier: identical ticket text reuses an analysis
+        # regardless of ticket id, day, or run
+        self.content_cache = FileCache(cache_dir / "by-content")
         self.api = api_client
+        # Cache reads/writes run here so they never block the event loop
+        self._io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="cache-io")
 
     async def extract_ticket(
         self,
@@ -31,31 +138,64 @@ class Extractor:
         semaphore: asyncio.Semaphore
     ) -> TicketAnalysis:
         """Extract analysis from a single ticket with caching."""
+        loop = asyncio.get_running_loop()
+
         # Check cache
         if self.cache.exists_dated(ticket_id, ticket_date):
-            cached = self.cache.get_dated(
+            cached = await loop.run_in_executor(
+                self._io_pool,
+                self.cache.get_dated,
                 ticket_id,
                 ticket_date,
-                lambda text: TicketAnalysis.model_validate_json(text)
+                _load_ticket
             )
             if cached:
                 return cached
 
-        # Call API
-        prompt = EXTRACT_PROMPT.format(ticket_content=ticket_content)
-        content = await self.api.call(prompt, max_tokens=1024, semaphore=semaphore)
-
-        # Parse and save
-        data = parse_json(content)
+        # Duplicate ticket text seen before skips the model entirely
+        content_key = _content_key(ticket_content)
+        duplicate = await loop.run_in_executor(
+            self._io_pool, self.content_cache.get, content_key, _load_ticket
+        )
+        if duplicate:
+            analysis = duplicate.model_copy(update={"ticket_id": ticket_id})
+            await self._persist(analysis, ticket_date)
+            return analysis
+
+        # Call API; the schema guarantees a parsed, field-complete dict
+        prompt = render_extract(ticket_content=ticket_content)
+        data = await self.api.call(
+            prompt, max_tokens=1024, semaphore=semaphore, schema=_EXTRACT_SCHEMA
+        )
         analysis = TicketAnalysis(ticket_id=ticket_id, **data)
-        self.cache.save_dated(
-            ticket_id,
+        await self._persist(analysis, ticket_date, content_key)
+
+        return analysis
+
+    async def _persist(
+        self,
+        analysis: TicketAnalysis,
+        ticket_date: date,
+        content_key: str | None = None
+    ) -> None:
+        """Write an analysis to the dated cache (and content tier if keyed)."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            self._io_pool,
+            self.cache.save_dated,
+            analysis.ticket_id,
             ticket_date,
             analysis,
-            lambda obj: obj.model_dump_json(indent=2)
+            _dump_ticket
         )
-
-        return analysis
+        if content_key is not None:
+            await loop.run_in_executor(
+                self._io_pool,
+                self.content_cache.save,
+                content_key,
+                analysis,
+                _dump_ticket
+            )
 
     async def extract_batch(
         self,
@@ -67,26 +207,36 @@ class Extractor:
         total = len(tickets)
         completed = 0
 
-        async def extract_with_progress(ticket: dict) -> TicketAnalysis:
-            nonlocal completed
+        def ticket_date_of(ticket: dict) -> date:
+            # created_at is ISO-8601: slice YYYY-MM-DD instead of a full parse
+            s = ticket["created_at"]
             try:
-                ticket_date = datetime.fromisoformat(
-                    ticket["created_at"].replace("Z", "+00:00")
-                ).date()
-            except (ValueError, AttributeError):
-                ticket_date = date.today()
+                return date(int(s[0:4]), int(s[5:7]), int(s[8:10]))
+            except (ValueError, TypeError):
+                return date.today()
+
+        ticket_dates = [ticket_date_of(t) for t in tickets]
+        # One directory scan per day replaces a stat() per ticket
+        self.cache.scan_dates(set(ticket_dates))
 
+        def report_progress() -> None:
+            # Throttled: one record per 64 completions instead of one per ticket
+            if completed == total or completed & 63 == 0:
+                logger.info("Progress: %d/%d tickets", completed, total)
+
+        async def extract_with_progress(ticket: dict, ticket_date: date) -> TicketAnalysis:
+            nonlocal completed
             try:
                 result = await self.extract_ticket(
                     ticket["id"], ticket["content"], ticket_date, semaphore
                 )
                 completed += 1
-                print(f"  Progress: {completed}/{total} tickets", end="\r")
+                report_progress()
                 return result
             except Exception as e:
                 completed += 1
-                print(f"\n  Warning: Failed to process {ticket['id']}: {e}")
-                print(f"  Progress: {completed}/{total} tickets", end="\r")
+                logger.warning("Failed to process %s: %s", ticket["id"], e)
+                report_progress()
                 # Return placeholder for failed tickets
                 return TicketAnalysis(
                     ticket_id=ticket["id"],
@@ -98,8 +248,127 @@ class Extractor:
                     summary=f"Failed to extract: {str(e)}"
                 )
 
-        results = await asyncio.gather(*[extract_with_progress(t) for t in tickets])
-        print(f"  Progress: {completed}/{total} tickets")
+        async def indexed(i: int, ticket: dict, ticket_date: date):
+            return i, await extract_with_progress(ticket, ticket_date)
+
+        # Consume completions as they land, checkpointing every K results
+        # to an append-only side-file so a crash never loses paid API work.
+        # Tasks are created in bounded chunks rather than all N up front.
+        results: list[TicketAnalysis | None] = [None] * total
+        checkpoint = self.cache.cache_dir / "results.jsonl"
+        pending: list[bytes] = []
+        indexed_tickets = list(enumerate(zip(tickets, ticket_dates)))
+        with open(checkpoint, "wb") as ckpt:
+            for chunk in _chunks(indexed_tickets, TASK_CHUNK_SIZE):
+                for fut in asyncio.as_completed([
+                    indexed(i, t, d) for i, (t, d) in chunk
+                ]):
+                    i, analysis = await fut
+                    results[i] = analysis
+                    pending.append(_TICKET_ADAPTER.dump_json(analysis))
+                    if len(pending) >= CHECKPOINT_EVERY:
+                        ckpt.write(b"\n".join(pending) + b"\n")
+                        ckpt.flush()
+                        pending.clear()
+            if pending:
+                ckpt.write(b"\n".join(pending) + b"\n")
+        return results
+
+    async def extract_packed(
+        self,
+        tickets: list[dict],
+        max_concurrent: int = 10,
+        pack_size: int = 10
+    ) -> list[TicketAnalysis]:
+        """Extract tickets in packs of pack_size per LLM call.
+
+        Cache hits are served individually; only uncached tickets are
+        packed. Any ticket a pack fails to cover falls back to
+        single-ticket extraction, so output matches extract_batch.
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+        loop = asyncio.get_running_loop()
+
+        def ticket_date_of(ticket: dict) -> date:
+            s = ticket["created_at"]
+            try:
+                return date(int(s[0:4]), int(s[5:7]), int(s[8:10]))
+            except (ValueError, TypeError):
+                return date.today()
+
+        ticket_dates = [ticket_date_of(t) for t in tickets]
+        self.cache.scan_dates(set(ticket_dates))
+
+        results: list[TicketAnalysis | None] = [None] * len(tickets)
+        uncached: list[tuple[int, dict, date]] = []
+        for i, (ticket, ticket_date) in enumerate(zip(tickets, ticket_dates)):
+            cached = None
+            if self.cache.exists_dated(ticket["id"], ticket_date):
+                cached = await loop.run_in_executor(
+                    self._io_pool,
+                    self.cache.get_dated,
+                    ticket["id"],
+                    ticket_date,
+                    _load_ticket
+                )
+            if cached:
+                results[i] = cached
+            else:
+                uncached.append((i, ticket, ticket_date))
+
+        async def extract_pack(pack: list[tuple[int, dict, date]]) -> None:
+            blocks = "\n\n".join(
+                f"Ticket ID: {ticket['id']}\n{ticket['content']}"
+                for _, ticket, _ in pack
+            )
+            prompt = render_extract_batch(tickets=blocks)
+            by_id: dict[str, dict] = {}
+            try:
+                data = await self.api.call(
+                    prompt,
+                    max_tokens=1024 * len(pack),
+                    semaphore=semaphore,
+                    schema=_EXTRACT_PACK_SCHEMA
+                )
+                by_id = {
+                    str(item.get("ticket_id")): item
+                    for item in data["analyses"] if isinstance(item, dict)
+                }
+            except Exception as e:
+                logger.warning("Pack extraction failed, falling back: %s", e)
+
+            for i, ticket, ticket_date in pack:
+                item = by_id.get(ticket["id"])
+                if item is not None:
+                    try:
+                        fields = {k: v for k, v in item.items() if k != "ticket_id"}
+                        analysis = TicketAnalysis(ticket_id=ticket["id"], **fields)
+                        await self._persist(
+                            analysis, ticket_date, _content_key(ticket["content"])
+                        )
+                        results[i] = analysis
+                        continue
+                    except Exception:
+                        pass
+                # Fallback: extract this ticket on its own
+                try:
+                    results[i] = await self.extract_ticket(
+                        ticket["id"], ticket["content"], ticket_date, semaphore
+                    )
+                except Exception as e:
+                    results[i] = TicketAnalysis(
+                        ticket_id=ticket["id"],
+                        category="error",
+                        product_area="unknown",
+                        sentiment="neutral",
+                        priority="low",
+                        themes=[],
+                        summary=f"Failed to extract: {str(e)}"
+                    )
+
+        await asyncio.gather(*[
+            extract_pack(pack) for pack in _chunks(uncached, pack_size)
+        ])
         return results
 
 
@@ -118,31 +387,36 @@ class Summarizer:
         """Generate summary for a single day with caching."""
         date_key = target_date.isoformat()
 
-        # Check cache
-        if self.cache.exists(date_key):
-            cached = self.cache.get(
-                date_key,
-                lambda text: DailySummary.model_validate_json(text)
-            )
-            if cached:
-                return cached
-
-        # Aggregate statistics
-        categories = Counter(a.category for a in analyses)
-        all_themes = [theme for a in analyses for theme in a.themes]
-        top_themes = Counter(all_themes).most_common(10)
+        # Check cache (get() is a single EAFP read; no exists() stat needed)
+        cached = await asyncio.to_thread(
+            self.cache.get, date_key, _SUMMARY_ADAPTER.validate_json
+        )
+        if cached:
+            return cached
+
+        # Aggregate statistics (np.unique counts in C instead of Counter)
+        cats, cat_counts = np.unique([a.category for a in analyses], return_counts=True)
+        categories = dict(zip(cats.tolist(), cat_counts.tolist()))
+
+        all_themes = list(chain.from_iterable(a.themes for a in analyses))
+        top_themes: dict[str, int] = {}
+        if all_themes:
+            themes, theme_counts = np.unique(all_themes, return_counts=True)
+            top = np.argpartition(-theme_counts, min(9, theme_counts.size - 1))[:10]
+            top = top[np.argsort(-theme_counts[top])]
+            theme_names = themes.tolist()
+            theme_totals = theme_counts.tolist()
+            top_themes = {theme_names[i]: theme_totals[i] for i in top.tolist()}
 
         # Get context from yesterday
         yesterday = target_date - timedelta(days=1)
         yesterday_key = yesterday.isoformat()
         previous_summary = "No previous summary"
-        if self.cache.exists(yesterday_key):
-            prev = self.cache.get(
-                yesterday_key,
-                lambda text: DailySummary.model_validate_json(text)
-            )
-            if prev:
-                previous_summary = prev.trend_analysis
+        prev = await asyncio.to_thread(
+            self.cache.get, yesterday_key, _SUMMARY_ADAPTER.validate_json
+        )
+        if prev:
+            previous_summary = prev.trend_analysis
 
         # Sample tickets for context
         samples = "\n".join([
@@ -151,69 +425,21 @@ class Summarizer:
         ])
 
         # Call API
-        prompt = SUMMARIZE_PROMPT.format(
+        prompt = render_summarize(
             ticket_count=len(analyses),
-            categories=dict(categories),
-            top_themes=dict(top_themes),
+            categories=categories,
+            top_themes=top_themes,
             samples=samples,
             previous_summary=previous_summary
         )
-        content = await self.api.call(prompt, max_tokens=2048)
-
-        # Parse and normalize
-        data = parse_json(content)
-        data = self._normalize(data)
+        data = await self.api.call(prompt, max_tokens=2048, schema=_SUMMARY_SCHEMA)
         summary = DailySummary(date=target_date, ticket_count=len(analyses), **data)
 
-        # Cache it
-        self.cache.save(
-            date_key,
-            summary,
-            lambda obj: obj.model_dump_json(indent=2)
-        )
+        # Cache it (off-loop; writes must not stall concurrent day summaries)
+        await asyncio.to_thread(self.cache.save, date_key, summary, _dump_summary)
 
         return summary
 
-    @staticmethod
-    def _normalize(data: dict) -> dict:
-        """Normalize LLM response to handle variations in structure."""
-        normalized = data.copy()
-
-        # Normalize trend_analysis
-        if "trend_analysis" in normalized:
-            trend = normalized["trend_analysis"]
-            if isinstance(trend, dict):
-                normalized["trend_analysis"] = (
-                    trend.get("note") or trend.get("text") or trend.get("analysis") or str(trend)
-                )
-            elif not isinstance(trend, str):
-                normalized["trend_analysis"] = str(trend)
-
-        # Normalize critical_issues
-        if "critical_issues" in normalized:
-            issues = normalized["critical_issues"]
-            if isinstance(issues, list):
-                normalized_issues = []
-                for issue in issues:
-                    if isinstance(issue, dict):
-                        normalized_issues.append(
-                            issue.get("issue") or issue.get("text") or issue.get("description") or str(issue)
-                        )
-                    else:
-                        normalized_issues.append(str(issue))
-                normalized["critical_issues"] = normalized_issues
-
-        # Normalize key_themes
-        if "key_themes" in normalized:
-            themes = normalized["key_themes"]
-            if isinstance(themes, list):
-                normalized["key_themes"] = [
-                    theme.get("theme") or str(theme) if isinstance(theme, dict) else str(theme)
-                    for theme in themes
-                ]
-
-        return normalized
-
 
 class Reporter:
     """Layer 3: Generate executive reports from summaries."""
@@ -225,20 +451,17 @@ class Reporter:
     async def generate_report(self, summaries: list[DailySummary]) -> Report:
         """Generate executive report from multiple daily summaries."""
         # Format summaries for prompt
-        summaries_text = "\n\n".join([
-            f"Date: {s.date}\nTickets: {s.ticket_count}\n"
-            f"Themes: {', '.join(s.key_themes)}\n"
-            f"Analysis: {s.trend_analysis}"
+        summaries_text = "\n\n".join(
+            _summary_block(
+                s.date.isoformat(), s.ticket_count,
+                tuple(s.key_themes), s.trend_analysis
+            )
             for s in summaries
-        ])
+        )
 
         # Call API
-        prompt = REPORT_PROMPT.format(summaries=summaries_text)
-        content = await self.api.call(prompt, max_tokens=4096)
-
-        # Parse and normalize
-        data = parse_json(content)
-        data = self._normalize(data)
+        prompt = render_report(summaries=summaries_text)
+        data = await self.api.call(prompt, max_tokens=4096, schema=_REPORT_SCHEMA)
 
         start = summaries[0].date
         end = summaries[-1].date
@@ -246,126 +469,6 @@ class Reporter:
 
         # Cache it
         report_key = f"report_{start}_{end}"
-        self.cache.save(
-            report_key,
-            report,
-            lambda obj: obj.model_dump_json(indent=2)
-        )
+        await asyncio.to_thread(self.cache.save, report_key, report, _dump_report)
 
         return report
-
-    @staticmethod
-    def _normalize(data: dict) -> dict:
-        """Normalize LLM response to handle variations in structure."""
-        normalized = data.copy()
-
-        # Normalize executive_summary
-        if "executive_summary" in normalized:
-            summary = normalized["executive_summary"]
-            if isinstance(summary, dict):
-                normalized["executive_summary"] = (
-                    summary.get("summary") or summary.get("text") or summary.get("note") or str(summary)
-                )
-            elif not isinstance(summary, str):
-                normalized["executive_summary"] = str(summary)
-
-        # Normalize health_snapshot
-        if "health_snapshot" in normalized:
-            hs = normalized["health_snapshot"]
-            if isinstance(hs, dict):
-                for field in ["overall_health", "ticket_volume_trend", "complaint_rate_trend"]:
-                    if field in hs and not isinstance(hs[field], str):
-                        hs[field] = str(hs[field])
-
-                if "top_3_drivers" in hs and isinstance(hs["top_3_drivers"], list):
-                    hs["top_3_drivers"] = [
-                        driver.get("driver") or str(driver) if isinstance(driver, dict) else str(driver)
-                        for driver in hs["top_3_drivers"]
-                    ]
-
-        # Normalize key_insights
-        if "key_insights" in normalized:
-            insights = normalized["key_insights"]
-            if isinstance(insights, list):
-                normalized_insights = []
-                for insight in insights:
-                    if isinstance(insight, dict):
-                        evidence = insight.get("evidence") or insight.get("text") or ""
-                        if isinstance(evidence, (list, dict)):
-                            evidence = str(evidence)
-
-                        customer_impact = insight.get("customer_impact") or insight.get("impact") or ""
-                        if isinstance(customer_impact, (list, dict)):
-                            customer_impact = str(customer_impact)
-
-                        normalized_insights.append({
-                            "insight": insight.get("insight") or str(insight),
-                            "severity": insight.get("severity") or "medium",
-                            "evidence": evidence,
-                            "customer_impact": customer_impact
-                        })
-                    else:
-                        normalized_insights.append({
-                            "insight": str(insight),
-                            "severity": "medium",
-                            "evidence": "",
-                            "customer_impact": ""
-                        })
-                normalized["key_insights"] = normalized_insights
-
-        # Normalize recommended_actions
-        if "recommended_actions" in normalized:
-            actions = normalized["recommended_actions"]
-            if isinstance(actions, list):
-                normalized_actions = []
-                for action in actions:
-                    if isinstance(action, dict):
-                        success_metrics = action.get("success_metrics") or action.get("metrics") or ""
-                        if isinstance(success_metrics, (list, dict)):
-                            success_metrics = str(success_metrics)
-
-                        normalized_actions.append({
-                            "action": action.get("action") or str(action),
-                            "priority": action.get("priority") or "this_week",
-                            "estimated_impact": action.get("estimated_impact") or "medium",
-                            "suggested_owner": action.get("suggested_owner") or action.get("owner") or "",
-                            "success_metrics": success_metrics
-                        })
-                    else:
-                        normalized_actions.append({
-                            "action": str(action),
-                            "priority": "this_week",
-                            "estimated_impact": "medium",
-                            "suggested_owner": "",
-                            "success_metrics": ""
-                        })
-                normalized["recommended_actions"] = normalized_actions
-
-        # Normalize customer_voice
-        if "customer_voice" in normalized:
-            cv = normalized["customer_voice"]
-            if isinstance(cv, dict):
-                if "quotes" in cv and isinstance(cv["quotes"], list):
-                    cv["quotes"] = [
-                        quote.get("quote") or str(quote) if isinstance(quote, dict) else str(quote)
-                        for quote in cv["quotes"]
-                    ]
-                else:
-                    cv["quotes"] = []
-            else:
-                normalized["customer_voice"] = {"quotes": []}
-
-        # Normalize week_over_week_comparison
-        if "week_over_week_comparison" in normalized:
-            wowc = normalized["week_over_week_comparison"]
-            if isinstance(wowc, dict):
-                for field in ["improved", "deteriorated", "stayed_same"]:
-                    if field in wowc and isinstance(wowc[field], list):
-                        wowc[field] = [
-                            item.get("item") or str(item) if isinstance(item, dict) else str(item)
-                            for item in wowc[field]
-                        ]
-                    else:
-                        wowc[field] = []
-
-        return normalized
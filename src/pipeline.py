@@ -1,193 +1,322 @@
 """Support ticket analysis pipeline - 3 layers (extract, summarize, report)."""
+import argparse
 import asyncio
-from datetime import date, datetime
+import logging
+import os
+from datetime import date
+from functools import lru_cache, singledispatch
+from hashlib import blake2b
 from pathlib import Path
 
+import jinja2
+import orjson
+import pandas as pd
+
 # Support both direct script execution and module import
 try:
-    from .csv_loader import load_tickets, get_date_range
+    from .csv_loader import load_tickets_with_range
     from .orchestrator import Extractor, Summarizer, Reporter
     from .client import APIClient
-    from .models import Report
 except ImportError:
-    from csv_loader import load_tickets, get_date_range
+    from csv_loader import load_tickets_with_range
     from orchestrator import Extractor, Summarizer, Reporter
     from client import APIClient
-    from models import Report
 
 
 DATA_DIR = Path("data")
 
+logger = logging.getLogger(__name__)
+
+
+def _load_manifest(path: Path) -> dict:
+    """Load the pipeline manifest, empty if missing or unreadable."""
+    try:
+        return orjson.loads(path.read_bytes())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return {}
+
+
+def _save_manifest(path: Path, manifest: dict) -> None:
+    """Write the manifest atomically via a temp file and os.replace."""
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_bytes(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+    os.replace(tmp, path)
+
+
+def _day_digest(day_analyses: list) -> str:
+    """Stable hash of a day's analysis set, for manifest invalidation."""
+    lines = sorted(f"{a.ticket_id}:{a.summary}" for a in day_analyses)
+    return blake2b("\n".join(lines).encode(), digest_size=16).hexdigest()
 
+
+@singledispatch
 def _format_value(value) -> str:
-    """Format value for markdown output."""
-    if isinstance(value, dict):
-        return "; ".join(f"{k}: {v}" for k, v in value.items())
-    elif isinstance(value, list):
-        return ", ".join(str(i) if not isinstance(i, (dict, list)) else _format_value(i) for i in value) or "N/A"
+    """Format value for markdown output, dispatched on type."""
     return str(value).strip()
 
 
-def _report_to_markdown(report: Report) -> str:
-    """Convert report to markdown format."""
-    lines = [
-        "# Support Ticket Analysis Report",
-        f"**Period:** {report.period}\n",
-        "## Executive Summary",
-        report.executive_summary,
-        "",
-        "## Health Snapshot"
-    ]
+@lru_cache(maxsize=256)
+def _format_dict(items: tuple) -> str:
+    """Join dict items; memoized since actions often share structure."""
+    return "; ".join(f"{k}: {v}" for k, v in items)
 
-    hs = report.health_snapshot
-    lines.extend([
-        f"- **Overall Health:** {hs.overall_health}",
-        f"- **Ticket Volume Trend:** {_format_value(hs.ticket_volume_trend)}",
-        f"- **Complaint Rate Trend:** {_format_value(hs.complaint_rate_trend)}",
-        "- **Top 3 Drivers:**",
-        *[f"  - {_format_value(d)}" for d in hs.top_3_drivers],
-        "",
-        "## Key Insights"
-    ])
 
-    for i, insight in enumerate(report.key_insights, 1):
-        lines.extend([
-            f"### Insight {i}: {insight.insight}",
-            f"- **Severity:** {insight.severity}",
-            f"- **Evidence:** {_format_value(insight.evidence)}",
-            f"- **Customer Impact:** {_format_value(insight.customer_impact)}",
-            ""
-        ])
+@_format_value.register
+def _(value: dict) -> str:
+    try:
+        return _format_dict(tuple(value.items()))
+    except TypeError:
+        # Unhashable nested values fall back to a direct join
+        return "; ".join(f"{k}: {v}" for k, v in value.items())
+
+
+@_format_value.register
+def _(value: list) -> str:
+    return ", ".join(
+        _format_value(i) if isinstance(i, (dict, list)) else str(i)
+        for i in value
+    ) or "N/A"
+
+
+# Markdown layout for the executive report. Compiled once at import into
+# a render function; stream().dump() writes blocks straight to the file
+# instead of building the whole document in memory first.
+REPORT_MD_TEMPLATE = """\
+# Support Ticket Analysis Report
+**Period:** {{ report.period }}
+
+## Executive Summary
+{{ report.executive_summary }}
+
+## Health Snapshot
+{% set hs = report.health_snapshot %}
+- **Overall Health:** {{ hs.overall_health }}
+- **Ticket Volume Trend:** {{ hs.ticket_volume_trend | fmt }}
+- **Complaint Rate Trend:** {{ hs.complaint_rate_trend | fmt }}
+- **Top 3 Drivers:**
+{% for driver in hs.top_3_drivers %}
+  - {{ driver | fmt }}
+{% endfor %}
+
+## Key Insights
+{% for insight in report.key_insights %}
+### Insight {{ loop.index }}: {{ insight.insight }}
+- **Severity:** {{ insight.severity }}
+- **Evidence:** {{ insight.evidence | fmt }}
+- **Customer Impact:** {{ insight.customer_impact | fmt }}
+
+{% endfor %}
+## Recommended Actions
+{% for action in report.recommended_actions %}
+### Action {{ loop.index }}: {{ action.action }}
+- **Priority:** {{ action.priority }}
+- **Estimated Impact:** {{ action.estimated_impact }}
+- **Suggested Owner:** {{ action.suggested_owner }}
+- **Success Metrics:** {{ action.success_metrics | fmt }}
+
+{% endfor %}
+{% if report.customer_voice.quotes %}
+## Customer Voice
+{% for quote in report.customer_voice.quotes %}
+> {{ quote | fmt }}
+{% endfor %}
+
+{% endif %}
+## Week-over-Week Comparison
+{% set wowc = report.week_over_week_comparison %}
+{% for heading, items in [
+    ("### Improved", wowc.improved),
+    ("### Deteriorated", wowc.deteriorated),
+    ("### Stayed the Same", wowc.stayed_same),
+] %}
+{% if items %}
+{{ heading }}
+{% for item in items %}
+- {{ item | fmt }}
+{% endfor %}
+
+{% endif %}
+{% endfor %}"""
+
+_md_env = jinja2.Environment(trim_blocks=True, lstrip_blocks=True)
+_md_env.filters["fmt"] = _format_value
+_render_report_md = _md_env.from_string(REPORT_MD_TEMPLATE)
+
 
-    lines.append("## Recommended Actions")
+def _log_summary(report, md_file: Path) -> None:
+    """Log the executive-summary console block at debug level."""
+    rule = "=" * 60
+    logger.debug(rule)
+    logger.debug("EXECUTIVE SUMMARY")
+    logger.debug(rule)
+    logger.debug("%s", report.executive_summary)
+    logger.debug("HEALTH SNAPSHOT:")
+    hs = report.health_snapshot
+    logger.debug("  Overall Health: %s", hs.overall_health)
+    logger.debug("  Ticket Volume Trend: %s", hs.ticket_volume_trend)
+    logger.debug("  Complaint Rate Trend: %s", hs.complaint_rate_trend)
+    logger.debug("  Top 3 Drivers: %s", ", ".join(hs.top_3_drivers))
+    logger.debug("KEY INSIGHTS:")
+    for i, insight in enumerate(report.key_insights, 1):
+        logger.debug("%d. [%s] %s", i, insight.severity.upper(), insight.insight)
+    logger.debug("RECOMMENDED ACTIONS:")
     for i, action in enumerate(report.recommended_actions, 1):
-        lines.extend([
-            f"### Action {i}: {action.action}",
-            f"- **Priority:** {action.priority}",
-            f"- **Estimated Impact:** {action.estimated_impact}",
-            f"- **Suggested Owner:** {action.suggested_owner}",
-            f"- **Success Metrics:** {_format_value(action.success_metrics)}",
-            ""
-        ])
+        logger.debug("%d. [%s] %s", i, action.priority.upper(), action.action)
+        if action.suggested_owner:
+            logger.debug("   Owner: %s", action.suggested_owner)
+    logger.debug("CUSTOMER VOICE:")
+    for quote in report.customer_voice.quotes:
+        logger.debug('  "%s"', quote)
+    logger.debug(rule)
+    logger.debug("Full report: %s", md_file)
+    logger.debug(rule)
+
 
-    if report.customer_voice.quotes:
-        lines.append("## Customer Voice")
-        lines.extend([f"> {_format_value(q)}" for q in report.customer_voice.quotes])
-        lines.append("")
-
-    lines.append("## Week-over-Week Comparison")
-    wowc = report.week_over_week_comparison
-    if wowc.improved:
-        lines.append("### Improved")
-        lines.extend([f"- {_format_value(i)}" for i in wowc.improved])
-        lines.append("")
-    if wowc.deteriorated:
-        lines.append("### Deteriorated")
-        lines.extend([f"- {_format_value(i)}" for i in wowc.deteriorated])
-        lines.append("")
-    if wowc.stayed_same:
-        lines.append("### Stayed the Same")
-        lines.extend([f"- {_format_value(i)}" for i in wowc.stayed_same])
-        lines.append("")
-
-    return "\n".join(lines)
-
-
-async def run_pipeline(start_date: date | None = None, end_date: date | None = None):
+async def run_pipeline(
+    start_date: date | None = None,
+    end_date: date | None = None,
+    max_workers: int = 10,
+    pack_size: int | None = None
+):
     """Run the complete 3-layer pipeline: extract → summarize → report."""
-    print("=== Support Ticket Analysis Pipeline ===\n")
+    logger.info("=== Support Ticket Analysis Pipeline ===")
 
     # Setup
     csv_file = DATA_DIR / "sofa-sogood.csv"
     if not csv_file.exists():
-        print(f"Error: {csv_file} not found")
+        logger.error("Error: %s not found", csv_file)
         return
 
-    # Determine date range
-    if start_date is None or end_date is None:
-        print("Determining date range from CSV...")
-        default_start, default_end = get_date_range(csv_file)
-        start_date = start_date or default_start
-        end_date = end_date or default_end
-        print(f"Date range: {start_date} to {end_date} (last 2 days)\n")
-
-    # Load tickets
-    print(f"Loading tickets from {csv_file}...")
-    tickets = load_tickets(csv_file, start_date, end_date)
-    print(f"Loaded {len(tickets)} tickets\n")
-
-    # Setup layers
-    api = APIClient()
-    extractor = Extractor(DATA_DIR / "analyses", api)
-    summarizer = Summarizer(DATA_DIR / "summaries", api)
-    reporter = Reporter(DATA_DIR / "reports", api)
-
-    # Layer 1: Extract
-    print("Extracting structured data from tickets...")
-    analyses = await extractor.extract_batch(tickets)
-    print(f"✓ Extracted {len(analyses)} analyses\n")
-
-    # Layer 2: Summarize by date
-    print("Generating daily summaries...")
-    by_date = {}
-    for ticket, analysis in zip(tickets, analyses):
-        try:
-            ticket_date = datetime.fromisoformat(
-                ticket["created_at"].replace("Z", "+00:00")
-            ).date()
-        except (ValueError, AttributeError):
-            ticket_date = date.today()
-        by_date.setdefault(ticket_date, []).append(analysis)
-
-    summaries = []
-    for target_date, day_analyses in sorted(by_date.items()):
-        summary = await summarizer.summarize_day(target_date, day_analyses)
-        summaries.append(summary)
-        print(f"✓ {target_date}: {summary.ticket_count} tickets")
-
-    # Layer 3: Report
-    if not summaries:
-        print("No summaries generated.")
-        return
+    # Load tickets and resolve the date range with one CSV read
+    logger.info("Loading tickets from %s...", csv_file)
+    start_date, end_date, tickets = load_tickets_with_range(
+        csv_file, start_date, end_date
+    )
+    logger.info("Date range: %s to %s", start_date, end_date)
+    logger.info("Loaded %d tickets", len(tickets))
+
+    # Setup layers; one APIClient (one shared connection pool) serves
+    # all three layers and is closed when the run finishes
+    async with APIClient() as api:
+        extractor = Extractor(DATA_DIR / "analyses", api)
+        summarizer = Summarizer(DATA_DIR / "summaries", api)
+        reporter = Reporter(DATA_DIR / "reports", api)
+
+        # Layer 1: Extract. Boilerplate duplicates (auto-replies, templated
+        # forms) are grouped so only one representative per group is sent.
+        logger.info("Extracting structured data from tickets...")
+        groups: dict[str, list[int]] = {}
+        for i, ticket in enumerate(tickets):
+            key = blake2b(
+                " ".join(ticket["content"].lower().split()).encode(),
+                digest_size=16
+            ).hexdigest()
+            groups.setdefault(key, []).append(i)
+        representatives = [tickets[idxs[0]] for idxs in groups.values()]
+        duplicates = len(tickets) - len(representatives)
+        if duplicates:
+            logger.info("%d duplicate tickets share a representative", duplicates)
+
+        if pack_size:
+            rep_analyses = await extractor.extract_packed(
+                representatives, pack_size=pack_size
+            )
+        else:
+            rep_analyses = await extractor.extract_batch(representatives)
+
+        # Fan each representative's analysis back out to its whole group
+        analyses = [None] * len(tickets)
+        for analysis, idxs in zip(rep_analyses, groups.values()):
+            for i in idxs:
+                ticket_id = tickets[i]["id"]
+                analyses[i] = (
+                    analysis if analysis.ticket_id == ticket_id
+                    else analysis.model_copy(update={"ticket_id": ticket_id})
+                )
+        logger.info("Extracted %d analyses", len(analyses))
+
+        # Layer 2: Summarize by date
+        logger.info("Generating daily summaries...")
+        # One vectorized to_datetime + groupby replaces a per-ticket parse loop
+        created = pd.Series([t["created_at"] for t in tickets], dtype="object")
+        parsed = pd.to_datetime(created, utc=True, errors="coerce")
+        ticket_days = parsed.dt.date.where(parsed.notna(), date.today())
+        by_date = {
+            ticket_day: [analyses[i] for i in idx]
+            for ticket_day, idx in
+            pd.Series(range(len(analyses))).groupby(ticket_days).groups.items()
+        }
+
+        # Manifest tracks each day's analysis-set hash; a day whose inputs
+        # changed gets its cached summary invalidated, everything else is
+        # skipped via the summary cache. Per-ticket skipping already happens
+        # in the extractor's dated cache.
+        manifest_file = DATA_DIR / "manifest.json"
+        manifest = _load_manifest(manifest_file)
+        day_hashes = manifest.setdefault("days", {})
+        for target_date, day_analyses in by_date.items():
+            date_key = target_date.isoformat()
+            digest = _day_digest(day_analyses)
+            if day_hashes.get(date_key) != digest:
+                summarizer.cache.invalidate(date_key)
+                day_hashes[date_key] = digest
 
-    print("\nGenerating executive report...")
-    report = await reporter.generate_report(summaries)
-    print("✓ Report generated\n")
+        # Summarize days concurrently (bounded); gather preserves date order.
+        # An uncached day may see "No previous summary" where the sequential
+        # loop would have chained onto the day before.
+        day_semaphore = asyncio.Semaphore(max_workers)
+
+        async def summarize_one(target_date: date, day_analyses: list) -> object:
+            async with day_semaphore:
+                return await summarizer.summarize_day(target_date, day_analyses)
+
+        summaries = await asyncio.gather(*[
+            summarize_one(target_date, day_analyses)
+            for target_date, day_analyses in sorted(by_date.items())
+        ])
+        for summary in summaries:
+            logger.info("%s: %d tickets", summary.date, summary.ticket_count)
+        _save_manifest(manifest_file, manifest)
+
+        # Layer 3: Report
+        if not summaries:
+            logger.warning("No summaries generated.")
+            return
+
+        logger.info("Generating executive report...")
+        report = await reporter.generate_report(summaries)
+        logger.info("Report generated")
 
     # Save markdown
-    print("Saving markdown report...")
-    md_content = _report_to_markdown(report)
+    logger.info("Saving markdown report...")
     start, end = report.period.split(" to ")
     md_file = DATA_DIR / "reports" / f"report_{start}_{end}.md"
-    md_file.write_text(md_content)
-    print(f"✓ Saved to {md_file}\n")
-
-    # Display summary
-    print("=" * 60)
-    print("EXECUTIVE SUMMARY")
-    print("=" * 60)
-    print(report.executive_summary)
-    print("\nHEALTH SNAPSHOT:")
-    hs = report.health_snapshot
-    print(f"  Overall Health: {hs.overall_health}")
-    print(f"  Ticket Volume Trend: {hs.ticket_volume_trend}")
-    print(f"  Complaint Rate Trend: {hs.complaint_rate_trend}")
-    print(f"  Top 3 Drivers: {', '.join(hs.top_3_drivers)}")
-    print("\nKEY INSIGHTS:")
-    for i, insight in enumerate(report.key_insights, 1):
-        print(f"{i}. [{insight.severity.upper()}] {insight.insight}")
-    print("\nRECOMMENDED ACTIONS:")
-    for i, action in enumerate(report.recommended_actions, 1):
-        print(f"{i}. [{action.priority.upper()}] {action.action}")
-        if action.suggested_owner:
-            print(f"   Owner: {action.suggested_owner}")
-    print("\nCUSTOMER VOICE:")
-    for quote in report.customer_voice.quotes:
-        print(f"  \"{quote}\"")
-    print("=" * 60)
-    print(f"Full report: {md_file}")
-    print("=" * 60)
+    def write_markdown() -> None:
+        with md_file.open("w", encoding="utf-8") as f:
+            _render_report_md.stream(report=report).dump(f)
+
+    await asyncio.to_thread(write_markdown)
+    logger.info("Saved to %s", md_file)
+
+    # Display summary (verbose only; nothing here is formatted unless
+    # the debug level is actually enabled)
+    if logger.isEnabledFor(logging.DEBUG):
+        _log_summary(report, md_file)
 
 
 if __name__ == "__main__":
-    asyncio.run(run_pipeline())
+    parser = argparse.ArgumentParser(description="Support ticket analysis pipeline")
+    parser.add_argument(
+        "--pack", type=int, default=None, metavar="K",
+        help="batch K tickets into each extraction call (default: one per call)"
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true",
+        help="also print the full executive-summary block"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(message)s"
+    )
+    asyncio.run(run_pipeline(pack_size=args.pack))
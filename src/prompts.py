@@ -1,16 +1,28 @@
 """Prompt templates."""
+import string
+
 
 EXTRACT_PROMPT = """Analyze this support ticket:
 
 {ticket_content}
 
-Extract JSON with: category, product_area, sentiment, priority, themes (list), summary
+Extract category, product_area, sentiment, priority, themes, and a summary.
 
 Categories: bug, feature_request, question, complaint
 Sentiments: positive, neutral, negative, frustrated
-Priorities: low, medium, high, critical
+Priorities: low, medium, high, critical"""
+
+
+EXTRACT_BATCH_PROMPT = """Analyze these support tickets:
+
+{tickets}
 
-Return ONLY valid JSON."""
+For EACH ticket, extract category, product_area, sentiment, priority,
+themes, and a summary, copying its ticket_id exactly.
+
+Categories: bug, feature_request, question, complaint
+Sentiments: positive, neutral, negative, frustrated
+Priorities: low, medium, high, critical"""
 
 
 SUMMARIZE_PROMPT = """Summarize today's support tickets.
@@ -25,12 +37,10 @@ Sample tickets:
 
 Yesterday's summary: {previous_summary}
 
-Generate JSON with:
-- key_themes: list of 5 most important themes
+Provide:
+- key_themes: the 5 most important themes
 - trend_analysis: how this compares to yesterday
-- critical_issues: anything requiring immediate attention
-
-Return ONLY valid JSON."""
+- critical_issues: anything requiring immediate attention"""
 
 
 REPORT_PROMPT = """Generate an executive report optimized for product team engagement and action.
@@ -38,49 +48,38 @@ REPORT_PROMPT = """Generate an executive report optimized for product team engag
 Last 7 days summaries:
 {summaries}
 
-Create a JSON report with the following structure:
-
-1. executive_summary:
-   - Start with the most critical insight (what changed and why it matters)
-   - Include key metrics with directional indicators (↑↓)
-   - End with business impact (customer satisfaction, revenue risk, brand reputation)
-   - Keep to 3-4 sentences max
-
-2. health_snapshot:
-   - overall_health: "critical" | "concerning" | "stable" | "improving" (with brief justification)
-   - ticket_volume_trend: numerical change with percentage
-   - complaint_rate_trend: numerical change with percentage
-   - top_3_drivers: list of issue types driving the most volume
-
-3. key_insights (5 insights, prioritized by impact):
-   For each insight provide:
-   - insight: the finding itself
-   - severity: "critical" | "high" | "medium" | "low"
-   - evidence: specific data points or patterns supporting this
-   - customer_impact: how this affects customer experience
-
-4. recommended_actions (3-5 actions, prioritized):
-   For each action provide:
-   - action: specific, actionable task
-   - priority: "immediate" | "this_week" | "this_month"
-   - estimated_impact: "high" | "medium" | "low" - expected reduction in ticket volume or complaint rate
-   - suggested_owner: which team should own this (e.g., "Engineering", "Operations", "Product", "Support")
-   - success_metrics: how to measure if this worked (specific KPIs)
-
-5. customer_voice:
-   - Include 2-3 verbatim ticket quotes or paraphrased examples that illustrate the most critical issues
-   - These should be emotionally resonant and help teams understand real customer pain
-
-6. week_over_week_comparison:
-   - Highlight what improved, what deteriorated, and what stayed the same
-   - Focus on actionable changes, not just descriptive stats
-
 Guidelines:
 - Use specific numbers over vague terms ("42% complaint rate" not "high complaints")
 - Frame insights around customer impact and business risk
 - Make actions concrete enough that teams can start immediately
 - Prioritize ruthlessly - what matters MOST right now
-- Use urgency appropriately (not everything is critical)
+- Use urgency appropriately (not everything is critical)"""
+
+
+
+def _compile(template: str):
+    """Pre-tokenize a .format template into a join-based renderer.
+
+    Parsing the format spec happens once at import instead of on every
+    prompt build.
+    """
+    tokens = [
+        (literal, field)
+        for literal, field, _spec, _conv in string.Formatter().parse(template)
+    ]
+
+    def render(**kwargs) -> str:
+        parts = []
+        for literal, field in tokens:
+            parts.append(literal)
+            if field is not None:
+                parts.append(str(kwargs[field]))
+        return "".join(parts)
+
+    return render
 
-Return ONLY valid JSON."""
 
+render_extract = _compile(EXTRACT_PROMPT)
+render_extract_batch = _compile(EXTRACT_BATCH_PROMPT)
+render_summarize = _compile(SUMMARIZE_PROMPT)
+render_report = _compile(REPORT_PROMPT)